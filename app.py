@@ -1,16 +1,12 @@
 from flask import Flask, render_template, request, jsonify
-import os
-from werkzeug.utils import secure_filename
+from werkzeug.exceptions import RequestEntityTooLarge
 from parser import CreditCardParser
 
 app = Flask(__name__)
-app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # 10MB max file size
 app.config['ALLOWED_EXTENSIONS'] = {'pdf'}
 
-# Creating uploads folder if it doesn't exist
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
-
+# The parser caches results by a hash of the statement, so re-uploads are not parsed again
 parser = CreditCardParser()
 
 def allowed_file(filename):
@@ -23,6 +19,10 @@ def index():
 @app.route('/parse', methods=['POST'])
 def parse_statement():
     try:
+        # Rejecting oversized uploads from the header before the body is buffered
+        if request.content_length and request.content_length > app.config['MAX_CONTENT_LENGTH']:
+            return jsonify({'success': False, 'error': 'File too large'}), 413
+        
         # Checking if file is present
         if 'file' not in request.files:
             return jsonify({'success': False, 'error': 'No file uploaded'}), 400
@@ -37,22 +37,14 @@ def parse_statement():
         if not allowed_file(file.filename):
             return jsonify({'success': False, 'error': 'Invalid file type. Only PDF files are allowed'}), 400
         
-        # Saving file securely
-        filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(filepath)
-        
-        # Parsing the PDF file
-        result = parser.parse(filepath)
-        
-        # Cleaning up - delete uploaded file
-        try:
-            os.remove(filepath)
-        except:
-            pass
+        # Handing the upload stream to the parser, which reads it into memory
+        result = parser.parse(file.stream)
         
         return jsonify(result)
     
+    except RequestEntityTooLarge:
+        return jsonify({'success': False, 'error': 'File too large'}), 413
+    
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
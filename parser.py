@@ -1,22 +1,366 @@
+import io
+import os
 import re
+import copy
+import hashlib
+import threading
+import multiprocessing
 import pdfplumber
+import pypdfium2 as pdfium
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from itertools import islice
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
+
+# ===== SHARED PATTERN PARTS =====
+
+_DATE_DMY = r'\d{2}/\d{2}/\d{4}'
+_DATE_DASH = r'\d{2}-[A-Za-z]{3}-\d{4}'
+_DATE_DOT = r'\d{2}\.\d{2}\.\d{4}'
+_AMOUNT = r'[\d,]+\.?\d*'
+_AMOUNT_STRICT = r'[\d,]+\.\d{2}'
+
+# ===== HDFC PATTERNS =====
+
+_HDFC_NAME_RE = re.compile(r'Name\s*:\s*([A-Z\s]+)')
+_HDFC_CARD_RE = re.compile(r'Card\s*No:\s*([\dX\s]+)')
+_HDFC_STATEMENT_DATE_RE = re.compile(rf'Statement\s*Date:\s*({_DATE_DMY})')
+_HDFC_DUE_DATE_RE = re.compile(rf'Payment\s*Due\s*Date\s*Total\s*Dues[^\n]*\n\s*({_DATE_DMY})')
+_HDFC_TOTAL_DUE_RE = re.compile(rf'Total\s*Dues[^\n]*\n\s*{_DATE_DMY}\s*({_AMOUNT})')
+_HDFC_MIN_DUE_RE = re.compile(rf'Minimum\s*Amount\s*Due[^\n]*\n\s*{_DATE_DMY}\s*{_AMOUNT}\s*({_AMOUNT})')
+_HDFC_CREDIT_LIMIT_RE = re.compile(r'Credit\s*Limit\s*Available[^\n]*\n\s*([\d,]+)')
+# Transaction patterns run over the whole text line by line; [^\S\n] is whitespace
+# other than a newline, so a match never runs onto the next line
+_HDFC_TXN_RE = re.compile(
+    rf'^[^\S\n]*({_DATE_DMY})[^\S\n]+(.+?)[^\S\n]+({_AMOUNT_STRICT})[^\S\n]*(Cr)?', re.MULTILINE
+)
+_HDFC_TXN_HEADERS = ('Domestic Transactions', 'International Transactions')
+
+# ===== ICICI PATTERNS =====
+
+_ICICI_NAME_RE = re.compile(r'MR\.\s+([A-Z\s]+)')
+_ICICI_CARD_RE = re.compile(r'(\d{4}[X]{6,}\d{4})')
+_ICICI_STATEMENT_DATE_RE = re.compile(r'STATEMENT\s*DATE[^\n]*\n[^\n]*\n[^\n]*\n([A-Za-z]+\s+\d{1,2},\s*\d{4})')
+_ICICI_DUE_DATE_RE = re.compile(r'PAYMENT\s*DUE\s*DATE[^\n]*\n[^\n]*\n[^\n]*\n([A-Za-z]+\s+\d{1,2},\s*\d{4})')
+_ICICI_TOTAL_DUE_RE = re.compile(rf'Total\s*Amount\s*due\s*`({_AMOUNT})')
+_ICICI_MIN_DUE_RE = re.compile(rf'Minimum\s*Amount\s*due\s*`({_AMOUNT})')
+_ICICI_CREDIT_LIMIT_RE = re.compile(rf'Credit\s*Limit[^\n]*\n\s*`({_AMOUNT})')
+_ICICI_TXN_RE = re.compile(rf'({_DATE_DMY})\s+\d+\s+(.+?)\s+\d+\s+({_AMOUNT})\s*(CR)?')
+
+# ===== AXIS PATTERNS =====
+
+_AXIS_NAME_RE = re.compile(r'([A-Z][a-z]+\s+[A-Z][a-z]+)\s*\nCredit\s*Card\s*Statement')
+_AXIS_CARD_RE = re.compile(r'Card\s*Number\s*:\s*([\d\*]+)')
+_AXIS_STATEMENT_DATE_RE = re.compile(rf'Statement\s*Date\s*({_DATE_DMY})')
+_AXIS_DUE_DATE_RE = re.compile(rf'Payment\s*Due\s*Date\s*({_DATE_DMY})')
+_AXIS_TOTAL_DUE_RE = re.compile(rf'Total\s*Amount\s*Due\s*r\s*({_AMOUNT})')
+_AXIS_MIN_DUE_RE = re.compile(rf'Minimum\s*Amount\s*Due\s*r\s*({_AMOUNT})')
+_AXIS_CREDIT_LIMIT_RE = re.compile(r'Credit\s*Limit\s*r\s*([\d,]+)')
+_AXIS_TXN_RE = re.compile(
+    rf'^[^\S\n]*({_DATE_DMY})[^\S\n]+(.+?)[^\S\n]+({_AMOUNT})[^\S\n]*(CR)?', re.MULTILINE
+)
+_AXIS_TXN_HEADERS = ('Transaction Date',)
+
+# ===== KOTAK PATTERNS =====
+
+_KOTAK_NAME_RE = re.compile(r'^([A-Z]+)\s+StatementDate', re.MULTILINE)
+_KOTAK_CARD_RE = re.compile(r'(\d{6}X+\d{4})')
+_KOTAK_STATEMENT_DATE_RE = re.compile(rf'Statement\s*Date\s*({_DATE_DASH})')
+_KOTAK_DUE_DATE_RE = re.compile(rf'Remember\s*to\s*Pay\s*By\s*({_DATE_DASH})')
+_KOTAK_TOTAL_DUE_RE = re.compile(rf'Total\s*Amount\s*Due\s*Rs\.\s*({_AMOUNT})')
+_KOTAK_MIN_DUE_RE = re.compile(rf'Minimum\s*Amount\s*Due\s*Rs\.\s*({_AMOUNT})')
+_KOTAK_CREDIT_LIMIT_RE = re.compile(rf'Total\s*Credit\s*Limit\s*Rs\.\s*({_AMOUNT})')
+# The letters-and-spaces run between description and amount is matched once in a
+# lookahead and consumed by backreference, so it is never re-split on backtracking
+_KOTAK_TXN_RE = re.compile(rf'({_DATE_DMY})\s+(.+?)(?=(\s[A-Za-z\s]+\s))\3({_AMOUNT})\s*(Cr)?')
+
+# ===== SBI PATTERNS =====
+
+_SBI_NAME_RE = re.compile(r'MR\.\s+([A-Z\s]+)')
+_SBI_CARD_RE = re.compile(r'(\d{4}\s*X+\s*X+\s*X+\s*\d{4})')
+_SBI_STATEMENT_DATE_RE = re.compile(r'Statement\s*Date\s*(\d{2}\s*[A-Z]{3}\s*\d{4})')
+_SBI_DUE_DATE_RE = re.compile(r'Payment\s*Due\s*Date\s*(\d{2}\s*[A-Z]{3}\s*\d{4})')
+_SBI_TOTAL_DUE_RE = re.compile(rf'Total\s*Payment\s*Due\s*({_AMOUNT})')
+_SBI_MIN_DUE_RE = re.compile(rf'Minimum\s*Payment\s*Due\s*({_AMOUNT})')
+_SBI_CREDIT_LIMIT_RE = re.compile(rf'Credit\s*Limit\s*({_AMOUNT})')
+_SBI_TXN_RE = re.compile(rf'({_DATE_DOT})\s+([A-Z]+)\s+(.+?)\s+({_AMOUNT})')
+
+# ===== GENERIC PATTERNS =====
+
+_GENERIC_NAME_RES = [
+    re.compile(r'(?:Name|Cardholder)[:\s]*([A-Z][A-Z\s\.]+)'),
+    re.compile(r'(?:Mr\.|Ms\.|Mrs\.)\s*([A-Z][A-Z\s]+)'),
+]
+_GENERIC_MASKED_CARD_RE = re.compile(r'(\d{4}[\sX*]{4,}\d{4})')
+# Masked number first; the 'Card ... 1234' fallback only consumes the 'C' so it
+# never swallows a masked number that starts later on the same line
+_GENERIC_CARD_RE = re.compile(_GENERIC_MASKED_CARD_RE.pattern + r'|C(?=ard.*?(\d{4}))')
+_GENERIC_DUE_DATE_RE = re.compile(
+    r'(?:Due\s*Date|Payment\s*Due)[:\s]*(\d{1,2}[\/\-][A-Za-z]{3}[\/\-]\d{2,4}|\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})',
+    re.IGNORECASE
+)
+_GENERIC_DUE_DATE_LABELS = ('due', 'payment')
+_GENERIC_AMOUNT_RE = re.compile(rf'(?:Total.*?Due|Amount.*?Due)[:\s]*(?:Rs\.?|₹)?\s*({_AMOUNT})', re.IGNORECASE)
+_GENERIC_AMOUNT_LABELS = ('total', 'amount')
+
+# Characters lower-cased at a time when looking for case-insensitive labels
+_FOLD_CHUNK = 4096
+
+# Provider names reported in parse results
+Provider = Literal['HDFC', 'ICICI', 'AXIS', 'KOTAK', 'SBI', 'Unknown']
+
+# Provider keywords in priority order; the first one present wins
+_PROVIDER_KEYWORDS: Tuple[Tuple[str, Provider], ...] = (
+    ('HDFC BANK', 'HDFC'),
+    ('ICICI BANK', 'ICICI'),
+    ('AXIS BANK', 'AXIS'),
+    ('KOTAK', 'KOTAK'),
+    ('STATE BANK OF INDIA', 'SBI'),
+    ('SBI', 'SBI')
+)
+
+# Fields extracted from every statement, in output order
+_FIELDS = (
+    'cardholder_name', 'card_number', 'statement_date', 'payment_due_date',
+    'total_amount_due', 'minimum_amount_due', 'credit_limit', 'transactions'
+)
+# Value reported for a field that could not be extracted
+_NOT_FOUND = 'Not Found'
+
+# Transaction types
+_CREDIT = 'Credit'
+_DEBIT = 'Debit'
+
+# Transactions are returned column by column, one list per key
+_TRANSACTION_COLUMNS = ('date', 'description', 'amount', 'type')
+
+# Every field except the transactions counts towards the confidence score
+_SCORED_FIELDS = _FIELDS[:-1]
+
+# Fields the generic parser can find; the others are always reported as not found
+_GENERIC_FIELDS = ('cardholder_name', 'card_number', 'payment_due_date', 'total_amount_due')
+
+# PDFium is not thread-safe, so documents are read one at a time across request threads
+_PDFIUM_LOCK = threading.Lock()
+
+# Pages scanned for the bank name before choosing a parser
+_DETECT_PAGES = 2
+
+# Leading characters checked for the bank name before scanning the rest
+_HEADER_CHARS = 2048
+
+# Bytes read at a time when hashing statement files
+_HASH_CHUNK = 1024 * 1024
+
+# Bytes in a content hash used as a result cache key
+_DIGEST_SIZE = 16
+
+
+def to_records(transactions: Dict[str, List[str]]) -> List[Dict[str, str]]:
+    """Convert column-oriented transactions into one dict per transaction"""
+    columns = [transactions[column] for column in _TRANSACTION_COLUMNS]
+    return [dict(zip(_TRANSACTION_COLUMNS, row)) for row in zip(*columns)]
+
+
+def _result_rank(result: Dict[str, Any]) -> Tuple[int, int]:
+    """Order successful parse results by confidence, then by transactions found"""
+    return result['confidence'], len(result['data']['transactions']['date'])
+
+
+def _content_digest(data: bytes) -> str:
+    """Hash statement bytes into a result cache key"""
+    return hashlib.blake2b(data, digest_size=_DIGEST_SIZE).hexdigest()
+
+
+def _file_digest(filepath: Union[str, os.PathLike]) -> Optional[str]:
+    """Hash a file's content, or return None if it cannot be read"""
+    digest = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    try:
+        with open(filepath, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                digest.update(chunk)
+    except OSError:
+        return None
+    return digest.hexdigest()
+
+
+def _search_at_label(text: str, label: str, pattern: re.Pattern) -> Optional[re.Match]:
+    """Match a label-anchored pattern only where its literal label occurs"""
+    pos = text.find(label)
+    while pos != -1:
+        match = pattern.match(text, pos)
+        if match:
+            return match
+        pos = text.find(label, pos + 1)
+    return None
+
+
+def _search_at_labels(text: str, labels: tuple, pattern: re.Pattern) -> Optional[re.Match]:
+    """Case-insensitive _search_at_label for several lower-case labels. The text is
+    lower-cased a chunk at a time, so an early match never pays for folding all of it"""
+    overlap = max(len(label) for label in labels) - 1
+    for start in range(0, len(text), _FOLD_CHUNK):
+        chunk = text[start:start + _FOLD_CHUNK + overlap]
+        folded = chunk.lower()
+        if len(folded) != len(chunk):
+            # Some characters lower-case to several, so offsets no longer line up
+            return pattern.search(text, start)
+        offsets = []
+        for label in labels:
+            pos = folded.find(label)
+            while pos != -1 and pos < _FOLD_CHUNK:
+                offsets.append(pos)
+                pos = folded.find(label, pos + 1)
+        for pos in sorted(offsets):
+            match = pattern.match(text, start + pos)
+            if match:
+                return match
+    return None
+
+
+def _iter_section_lines(text: str, headers: tuple, pattern: re.Pattern) -> Iterator[re.Match]:
+    """Yield line-anchored matches below the first line naming one of the section
+    headers, skipping any later line that repeats a header"""
+    header_lines = set()
+    for header in headers:
+        pos = text.find(header)
+        while pos != -1:
+            header_lines.add(text.rfind('\n', 0, pos) + 1)
+            pos = text.find(header, pos + 1)
+    if not header_lines:
+        return
+    start = text.find('\n', min(header_lines))
+    if start == -1:
+        return
+    for match in pattern.finditer(text, start + 1):
+        # Matches start at the beginning of their line
+        if match.start() not in header_lines:
+            yield match
+
+
+def _search_with_literal(text: str, literal: str, pattern: re.Pattern,
+                         lead: Optional[int] = None) -> Optional[re.Match]:
+    """Run pattern only if a literal that every match contains is present"""
+    pos = text.find(literal)
+    if pos == -1:
+        return None
+    # When the literal sits at a fixed offset into the match, no match can
+    # start more than `lead` characters before its first occurrence
+    start = max(pos - lead, 0) if lead is not None else 0
+    return pattern.search(text, start)
+
+
+def _finditer_with_literal(text: str, literal: str, pattern: re.Pattern,
+                           lead: int) -> Iterator[re.Match]:
+    """finditer for a pattern whose matches all have literal exactly `lead` characters
+    in, trying only the positions that put an occurrence of it there"""
+    pos = text.find(literal, lead)
+    while pos != -1:
+        match = pattern.match(text, pos - lead)
+        if match:
+            yield match
+            pos = text.find(literal, match.end() + lead)
+        else:
+            pos = text.find(literal, pos + 1)
+
 
 class CreditCardParser:
-    def __init__(self):
+    def __init__(self, cache_size: int = 128):
+        # Successful parse results keyed by file content hash, least recently used first
+        self.cache_size = cache_size
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        
+        # Extractors per provider, in the same order as _FIELDS
         self.providers = {
-            'HDFC': self._parse_hdfc,
-            'ICICI': self._parse_icici,
-            'AXIS': self._parse_axis,
-            'KOTAK': self._parse_kotak,
-            'SBI': self._parse_sbi
+            'HDFC': (
+                self._extract_hdfc_name, self._extract_hdfc_card,
+                self._extract_hdfc_statement_date, self._extract_hdfc_due_date,
+                self._extract_hdfc_total_due, self._extract_hdfc_min_due,
+                self._extract_hdfc_credit_limit, self._extract_hdfc_transactions
+            ),
+            'ICICI': (
+                self._extract_icici_name, self._extract_icici_card,
+                self._extract_icici_statement_date, self._extract_icici_due_date,
+                self._extract_icici_total_due, self._extract_icici_min_due,
+                self._extract_icici_credit_limit, self._extract_icici_transactions
+            ),
+            'AXIS': (
+                self._extract_axis_name, self._extract_axis_card,
+                self._extract_axis_statement_date, self._extract_axis_due_date,
+                self._extract_axis_total_due, self._extract_axis_min_due,
+                self._extract_axis_credit_limit, self._extract_axis_transactions
+            ),
+            'KOTAK': (
+                self._extract_kotak_name, self._extract_kotak_card,
+                self._extract_kotak_statement_date, self._extract_kotak_due_date,
+                self._extract_kotak_total_due, self._extract_kotak_min_due,
+                self._extract_kotak_credit_limit, self._extract_kotak_transactions
+            ),
+            'SBI': (
+                self._extract_sbi_name, self._extract_sbi_card,
+                self._extract_sbi_statement_date, self._extract_sbi_due_date,
+                self._extract_sbi_total_due, self._extract_sbi_min_due,
+                self._extract_sbi_credit_limit, self._extract_sbi_transactions
+            )
         }
     
-    def parse(self, filepath: str) -> Dict[str, Any]:
-        """Main parsing method"""
+    def parse(self, source: Union[str, os.PathLike, BinaryIO]) -> Dict[str, Any]:
+        """Main parsing method; source is a file path or a binary file-like object.
+        Successful results are cached by file content, so a statement seen before is
+        not read again; every call returns a separate result object"""
+        try:
+            if isinstance(source, (str, os.PathLike)):
+                digest = _file_digest(source)
+            else:
+                # Streams are read into memory once, both to hash them and so the
+                # pdfplumber fallback can read them again
+                data = source.read()
+                digest = _content_digest(data)
+                source = io.BytesIO(data)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Failed to read PDF: {str(e)}'
+            }
+        
+        cached = self._get_cached_result(digest) if digest else None
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        result = self._parse_source(source)
+        self._cache_result(digest, result)
+        return result
+    
+    def _parse_source(self, source: Union[str, os.PathLike, BinaryIO]) -> Dict[str, Any]:
+        """Parse a statement with PDFium, falling back to pdfplumber, without the cache"""
+        try:
+            # Paths are opened afresh by each reader; streams are rewound for the fallback
+            is_stream = not isinstance(source, (str, os.PathLike)) and hasattr(source, 'seek')
+            start = source.tell() if is_stream else None
+        except Exception as e:
+            return {
+                'success': False,
+                'error': f'Failed to read PDF: {str(e)}'
+            }
+        
+        result = self._parse_pages(self._iter_pages(self._iter_pages_pdfium, source))
+        if not self._needs_fallback(result):
+            return result
+        
+        # The patterns were written against pdfplumber's layout-ordered text, so a
+        # statement PDFium could not read or fully parse is read again with pdfplumber
+        fallback = self._parse_pages(self._iter_pages(self._iter_pages_pdfplumber, source, start))
+        if not result['success'] or (fallback['success'] and _result_rank(fallback) > _result_rank(result)):
+            return fallback
+        return result
+    
+    def _parse_pages(self, pages: Iterator[str]) -> Dict[str, Any]:
+        """Detect the provider and extract fields from a stream of page texts"""
         try:
-            text = self._extract_text(filepath)
+            # The bank name is on the letterhead, so the first pages are enough to detect it
+            text = "".join(islice(pages, _DETECT_PAGES))
             
             if not text:
                 return {
@@ -27,9 +371,11 @@ class CreditCardParser:
             provider = self._detect_provider(text)
             
             if provider in self.providers:
-                data = self.providers[provider](text)
+                # Transactions can be on any page, so bank statements are always read in full
+                text += "".join(pages)
+                data = self._parse_fields(text, provider)
             else:
-                data = self._parse_generic(text)
+                data = self._parse_generic_pages(text, pages)
             
             return {
                 'success': True,
@@ -43,321 +389,383 @@ class CreditCardParser:
                 'success': False,
                 'error': f'Parsing error: {str(e)}'
             }
-    
-    def _extract_text(self, filepath: str) -> str:
-        """Extract text from PDF using pdfplumber"""
-        text = ""
+        
+        finally:
+            pages.close()
+    
+    def parse_many(self, filepaths: List[Union[str, os.PathLike]], num_workers: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Parse several statement files in worker processes, returning results in input order.
+        Files with identical content are parsed once, and files seen by an earlier call are
+        answered from the result cache; every returned result is a separate object"""
+        if num_workers is None:
+            num_workers = min(os.cpu_count() or 1, 4)
+        
+        # Unreadable files are keyed by path so parse() reports their error
+        digests = [_file_digest(filepath) for filepath in filepaths]
+        keys = [digest or filepath for digest, filepath in zip(digests, filepaths)]
+        results = {}
+        pending = {}
+        for key, digest, filepath in zip(keys, digests, filepaths):
+            if key in results or key in pending:
+                continue
+            cached = self._get_cached_result(digest) if digest else None
+            if cached is not None:
+                results[key] = cached
+            else:
+                pending[key] = (filepath, digest)
+        sources = [filepath for filepath, _ in pending.values()]
+        
+        # Files are already hashed, so the workers skip parse() and its cache lookup
+        if num_workers <= 1 or len(sources) <= 1:
+            parsed = [self._parse_source(filepath) for filepath in sources]
+        else:
+            # Spawned workers start clean instead of inheriting a held _PDFIUM_LOCK from another thread
+            context = multiprocessing.get_context('spawn')
+            with ProcessPoolExecutor(max_workers=min(num_workers, len(sources)), mp_context=context) as executor:
+                parsed = list(executor.map(self._parse_source, sources))
+        
+        for (key, (_, digest)), result in zip(pending.items(), parsed):
+            self._cache_result(digest, result)
+            results[key] = result
+        
+        # Cache hits and repeats get copies so callers can modify each result freely
+        returned = set()
+        output = []
+        for key in keys:
+            result = results[key]
+            if key in returned or key not in pending:
+                result = copy.deepcopy(result)
+            returned.add(key)
+            output.append(result)
+        return output
+    
+    def _get_cached_result(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._result_cache_lock:
+            result = self._result_cache.get(key)
+            if result is not None:
+                self._result_cache.move_to_end(key)
+            return result
+    
+    def _cache_result(self, key: Optional[str], result: Dict[str, Any]) -> None:
+        # Only successful parses of readable files are cached so failures are retried,
+        # and the cache keeps its own copy so callers can modify the result they got
+        if not key or not result.get('success'):
+            return
+        result = copy.deepcopy(result)
+        with self._result_cache_lock:
+            self._result_cache[key] = result
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.cache_size:
+                self._result_cache.popitem(last=False)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # Worker processes get a parser without the cache, whose lock cannot be pickled
+        state = self.__dict__.copy()
+        del state['_result_cache'], state['_result_cache_lock']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+    
+    def _iter_pages(self, read_pages: Callable[[Union[str, os.PathLike, BinaryIO]], Iterator[str]],
+                    source: Union[str, os.PathLike, BinaryIO], start: Optional[int] = None) -> Iterator[str]:
+        """Yield the text of each page from one of the _iter_pages_* readers, first
+        seeking a stream source back to start when one is given"""
         try:
-            with pdfplumber.open(filepath) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n"
-            return text
+            if start is not None:
+                source.seek(start)
+            yield from read_pages(source)
         except Exception as e:
             raise Exception(f"Failed to read PDF: {str(e)}")
     
-    def _detect_provider(self, text: str) -> str:
+    def _needs_fallback(self, result: Dict[str, Any]) -> bool:
+        """Whether a result is missing fields its provider's parser can extract"""
+        if not result['success']:
+            return True
+        if result['provider'] not in self.providers:
+            return any(result['data'][key] in ('', _NOT_FOUND) for key in _GENERIC_FIELDS)
+        # An empty transaction table usually means the rows came out in an order the
+        # transaction pattern does not expect, so that is retried as well
+        return (any(result['data'][key] in ('', _NOT_FOUND) for key in _SCORED_FIELDS)
+                or not result['data']['transactions']['date'])
+    
+    def _iter_pages_pdfium(self, source: Union[str, os.PathLike, BinaryIO]) -> Iterator[str]:
+        """Yield raw page text with PDFium, skipping pdfplumber's layout analysis"""
+        with _PDFIUM_LOCK:
+            pdf = pdfium.PdfDocument(source)
+            page_count = len(pdf)
+        try:
+            for i in range(page_count):
+                # Only hold the lock while inside PDFium, not while the caller works on the page
+                with _PDFIUM_LOCK:
+                    page = pdf[i]
+                    textpage = page.get_textpage()
+                    try:
+                        page_text = textpage.get_text_range()
+                    finally:
+                        textpage.close()
+                        page.close()
+                if page_text.strip():
+                    # PDFium separates lines with CRLF; the patterns expect LF
+                    yield page_text.replace('\r\n', '\n') + "\n"
+        finally:
+            with _PDFIUM_LOCK:
+                pdf.close()
+    
+    def _iter_pages_pdfplumber(self, source: Union[str, os.PathLike, BinaryIO]) -> Iterator[str]:
+        """Yield page text using pdfplumber"""
+        with pdfplumber.open(source) as pdf:
+            for page in pdf.pages:
+                page_text = page.extract_text()
+                if page_text:
+                    yield page_text + "\n"
+    
+    def _detect_provider(self, text: str) -> Provider:
         """Detect credit card provider from text"""
-        text_upper = text.upper()
+        # The bank name sits on the letterhead, so only upper-case the header and
+        # fall back to the whole text when it names no bank. A bare 'SBI' is not
+        # trusted there since it also appears in boilerplate such as "(BCSBI)"
+        keyword, provider = self._match_provider(text[:_HEADER_CHARS].upper())
+        if keyword is None or keyword == 'SBI':
+            keyword, provider = self._match_provider(text.upper())
+        return provider
+    
+    def _match_provider(self, text_upper: str) -> Tuple[Optional[str], Provider]:
+        """Return the first provider keyword found in upper-cased text and its provider"""
+        for keyword, provider in _PROVIDER_KEYWORDS:
+            if keyword in text_upper:
+                return keyword, provider
+        return None, 'Unknown'
+    
+    def _parse_fields(self, text: str, provider: Provider) -> Dict[str, Any]:
+        """Run the provider's extractors over the statement text"""
+        extractors = self.providers.get(provider)
+        if extractors is None:
+            return self._parse_generic(text)
+        return dict(zip(_FIELDS, [extract(text) for extract in extractors]))
+    
+    def _parse_generic_pages(self, text: str, pages: Iterator[str]) -> Dict[str, Any]:
+        """Run the generic parser, reading further pages only while fields are missing
+        or hold a fallback-pattern match that a later page could still replace"""
+        data = self._parse_generic(text)
+        extractors = {
+            'cardholder_name': self._extract_generic_name,
+            'card_number': self._extract_generic_card,
+            'payment_due_date': self._extract_generic_due_date,
+            'total_amount_due': self._extract_generic_amount
+        }
+        missing = [key for key in extractors if not self._generic_field_settled(key, data[key], text)]
         
-        if 'HDFC BANK' in text_upper:
-            return 'HDFC'
-        elif 'ICICI BANK' in text_upper:
-            return 'ICICI'
-        elif 'AXIS BANK' in text_upper:
-            return 'AXIS'
-        elif 'KOTAK' in text_upper:
-            return 'KOTAK'
-        elif 'STATE BANK OF INDIA' in text_upper or 'SBI' in text_upper:
-            return 'SBI'
+        # Pages are joined in doubling batches, so re-running the extractors over the
+        # growing text costs a small multiple of one pass instead of one pass per page
+        batch = 1
+        while missing:
+            more_text = "".join(islice(pages, batch))
+            if not more_text:
+                break
+            text += more_text
+            batch *= 2
+            for key in missing:
+                data[key] = extractors[key](text)
+            missing = [key for key in missing if not self._generic_field_settled(key, data[key], text)]
         
-        return 'Unknown'
-    
-    def _parse_hdfc(self, text: str) -> Dict[str, Any]:
-        """Parse HDFC credit card statement"""
-        data = {
-            'cardholder_name': self._extract_hdfc_name(text),
-            'card_number': self._extract_hdfc_card(text),
-            'statement_date': self._extract_hdfc_statement_date(text),
-            'payment_due_date': self._extract_hdfc_due_date(text),
-            'total_amount_due': self._extract_hdfc_total_due(text),
-            'minimum_amount_due': self._extract_hdfc_min_due(text),
-            'credit_limit': self._extract_hdfc_credit_limit(text),
-            'transactions': self._extract_hdfc_transactions(text)
-        }
-        return data
-    
-    def _parse_icici(self, text: str) -> Dict[str, Any]:
-        """Parse ICICI credit card statement"""
-        data = {
-            'cardholder_name': self._extract_icici_name(text),
-            'card_number': self._extract_icici_card(text),
-            'statement_date': self._extract_icici_statement_date(text),
-            'payment_due_date': self._extract_icici_due_date(text),
-            'total_amount_due': self._extract_icici_total_due(text),
-            'minimum_amount_due': self._extract_icici_min_due(text),
-            'credit_limit': self._extract_icici_credit_limit(text),
-            'transactions': self._extract_icici_transactions(text)
-        }
-        return data
-    
-    def _parse_axis(self, text: str) -> Dict[str, Any]:
-        """Parse Axis Bank credit card statement"""
-        data = {
-            'cardholder_name': self._extract_axis_name(text),
-            'card_number': self._extract_axis_card(text),
-            'statement_date': self._extract_axis_statement_date(text),
-            'payment_due_date': self._extract_axis_due_date(text),
-            'total_amount_due': self._extract_axis_total_due(text),
-            'minimum_amount_due': self._extract_axis_min_due(text),
-            'credit_limit': self._extract_axis_credit_limit(text),
-            'transactions': self._extract_axis_transactions(text)
-        }
         return data
     
-    def _parse_kotak(self, text: str) -> Dict[str, Any]:
-        """Parse Kotak credit card statement"""
-        data = {
-            'cardholder_name': self._extract_kotak_name(text),
-            'card_number': self._extract_kotak_card(text),
-            'statement_date': self._extract_kotak_statement_date(text),
-            'payment_due_date': self._extract_kotak_due_date(text),
-            'total_amount_due': self._extract_kotak_total_due(text),
-            'minimum_amount_due': self._extract_kotak_min_due(text),
-            'credit_limit': self._extract_kotak_credit_limit(text),
-            'transactions': self._extract_kotak_transactions(text)
-        }
-        return data
-    
-    def _parse_sbi(self, text: str) -> Dict[str, Any]:
-        """Parse SBI credit card statement"""
-        data = {
-            'cardholder_name': self._extract_sbi_name(text),
-            'card_number': self._extract_sbi_card(text),
-            'statement_date': self._extract_sbi_statement_date(text),
-            'payment_due_date': self._extract_sbi_due_date(text),
-            'total_amount_due': self._extract_sbi_total_due(text),
-            'minimum_amount_due': self._extract_sbi_min_due(text),
-            'credit_limit': self._extract_sbi_credit_limit(text),
-            'transactions': self._extract_sbi_transactions(text)
-        }
-        return data
+    def _generic_field_settled(self, key: str, value: str, text: str) -> bool:
+        """Whether more text can no longer change a generic field. A name or card number
+        found by the fallback pattern still loses to a 'Name'/'Cardholder' label or a
+        masked number anywhere in the statement"""
+        if value == _NOT_FOUND:
+            return False
+        if key == 'cardholder_name':
+            return _GENERIC_NAME_RES[0].search(text) is not None
+        if key == 'card_number':
+            return _GENERIC_MASKED_CARD_RE.search(text) is not None
+        return True
     
     def _parse_generic(self, text: str) -> Dict[str, Any]:
         """Generic parser for unknown providers"""
         return {
             'cardholder_name': self._extract_generic_name(text),
             'card_number': self._extract_generic_card(text),
-            'statement_date': 'Not Found',
+            'statement_date': _NOT_FOUND,
             'payment_due_date': self._extract_generic_due_date(text),
             'total_amount_due': self._extract_generic_amount(text),
-            'minimum_amount_due': 'Not Found',
-            'credit_limit': 'Not Found',
-            'transactions': []
+            'minimum_amount_due': _NOT_FOUND,
+            'credit_limit': _NOT_FOUND,
+            'transactions': {column: [] for column in _TRANSACTION_COLUMNS}
         }
     
     # ===== HDFC EXTRACTION METHODS =====
     
     def _extract_hdfc_name(self, text: str) -> str:
-        match = re.search(r'Name\s*:\s*([A-Z\s]+)', text)
+        match = _search_at_label(text, 'Name', _HDFC_NAME_RE)
         if match:
             return match.group(1).strip()
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_hdfc_card(self, text: str) -> str:
-        match = re.search(r'Card\s*No:\s*([\dX\s]+)', text)
+        match = _search_at_label(text, 'Card', _HDFC_CARD_RE)
         if match:
             return match.group(1).strip()
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_hdfc_statement_date(self, text: str) -> str:
-        match = re.search(r'Statement\s*Date:\s*(\d{2}/\d{2}/\d{4})', text)
+        match = _search_at_label(text, 'Statement', _HDFC_STATEMENT_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_hdfc_due_date(self, text: str) -> str:
-        match = re.search(r'Payment\s*Due\s*Date\s*Total\s*Dues[^\n]*\n\s*(\d{2}/\d{2}/\d{4})', text)
+        match = _search_at_label(text, 'Payment', _HDFC_DUE_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_hdfc_total_due(self, text: str) -> str:
-        match = re.search(r'Total\s*Dues[^\n]*\n\s*\d{2}/\d{2}/\d{4}\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Total', _HDFC_TOTAL_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_hdfc_min_due(self, text: str) -> str:
-        match = re.search(r'Minimum\s*Amount\s*Due[^\n]*\n\s*\d{2}/\d{2}/\d{4}\s*[\d,]+\.?\d*\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Minimum', _HDFC_MIN_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_hdfc_credit_limit(self, text: str) -> str:
-        match = re.search(r'Credit\s*Limit\s*Available[^\n]*\n\s*([\d,]+)', text)
+        match = _search_at_label(text, 'Credit', _HDFC_CREDIT_LIMIT_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
-    
-    def _extract_hdfc_transactions(self, text: str) -> List[Dict]:
-        transactions = []
-        lines = text.split('\n')
-        in_transaction_section = False
-        
-        for line in lines:
-            if 'Domestic Transactions' in line or 'International Transactions' in line:
-                in_transaction_section = True
-                continue
-            
-            if in_transaction_section:
-                match = re.match(r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d,]+\.\d{2})\s*(Cr)?', line.strip())
-                if match:
-                    transactions.append({
-                        'date': match.group(1),
-                        'description': match.group(2).strip(),
-                        'amount': f"₹{match.group(3)}",
-                        'type': 'Credit' if match.group(4) else 'Debit'
-                    })
+        return _NOT_FOUND
+    
+    def _extract_hdfc_transactions(self, text: str) -> Dict[str, List[str]]:
+        dates, descriptions, amounts, types = [], [], [], []
+        for match in _iter_section_lines(text, _HDFC_TXN_HEADERS, _HDFC_TXN_RE):
+            dates.append(match.group(1))
+            descriptions.append(match.group(2).strip())
+            amounts.append(f"₹{match.group(3)}")
+            types.append(_CREDIT if match.group(4) else _DEBIT)
         
-        return transactions
+        return {'date': dates, 'description': descriptions, 'amount': amounts, 'type': types}
     
     # ===== ICICI EXTRACTION METHODS =====
     
     def _extract_icici_name(self, text: str) -> str:
-        match = re.search(r'MR\.\s+([A-Z\s]+)', text)
+        match = _search_at_label(text, 'MR.', _ICICI_NAME_RE)
         if match:
-            name = match.group(1).strip()
-            # Stop at address indicators
-            name = re.split(r'\d{3,}|[A-Z]{2,}\s+B\s+\d+', name)[0].strip()
-            return name
-        return 'Not Found'
+            return match.group(1).strip()
+        return _NOT_FOUND
     
     def _extract_icici_card(self, text: str) -> str:
-        match = re.search(r'(\d{4}[X]{6,}\d{4})', text)
+        match = _search_with_literal(text, 'XXXXXX', _ICICI_CARD_RE, lead=4)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_icici_statement_date(self, text: str) -> str:
-        match = re.search(r'STATEMENT\s*DATE[^\n]*\n[^\n]*\n[^\n]*\n([A-Za-z]+\s+\d{1,2},\s*\d{4})', text)
+        match = _search_at_label(text, 'STATEMENT', _ICICI_STATEMENT_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_icici_due_date(self, text: str) -> str:
-        match = re.search(r'PAYMENT\s*DUE\s*DATE[^\n]*\n[^\n]*\n[^\n]*\n([A-Za-z]+\s+\d{1,2},\s*\d{4})', text)
+        match = _search_at_label(text, 'PAYMENT', _ICICI_DUE_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_icici_total_due(self, text: str) -> str:
-        match = re.search(r'Total\s*Amount\s*due\s*`([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Total', _ICICI_TOTAL_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_icici_min_due(self, text: str) -> str:
-        match = re.search(r'Minimum\s*Amount\s*due\s*`([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Minimum', _ICICI_MIN_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_icici_credit_limit(self, text: str) -> str:
-        match = re.search(r'Credit\s*Limit[^\n]*\n\s*`([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Credit', _ICICI_CREDIT_LIMIT_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
-    
-    def _extract_icici_transactions(self, text: str) -> List[Dict]:
-        transactions = []
-        pattern = r'(\d{2}/\d{2}/\d{4})\s+\d+\s+(.+?)\s+\d+\s+([\d,]+\.?\d*)\s*(CR)?'
+        return _NOT_FOUND
+    
+    def _extract_icici_transactions(self, text: str) -> Dict[str, List[str]]:
+        dates, descriptions, amounts, types = [], [], [], []
+        for match in _finditer_with_literal(text, '/', _ICICI_TXN_RE, lead=2):
+            dates.append(match.group(1))
+            descriptions.append(match.group(2).strip())
+            amounts.append(f"₹{match.group(3)}")
+            types.append(_CREDIT if match.group(4) else _DEBIT)
         
-        for match in re.finditer(pattern, text):
-            transactions.append({
-                'date': match.group(1),
-                'description': match.group(2).strip(),
-                'amount': f"₹{match.group(3)}",
-                'type': 'Credit' if match.group(4) else 'Debit'
-            })
-        
-        return transactions
+        return {'date': dates, 'description': descriptions, 'amount': amounts, 'type': types}
     
     # ===== AXIS EXTRACTION METHODS =====
     
     def _extract_axis_name(self, text: str) -> str:
-        match = re.search(r'([A-Z][a-z]+\s+[A-Z][a-z]+)\s*\nCredit\s*Card\s*Statement', text)
+        match = _search_with_literal(text, '\nCredit', _AXIS_NAME_RE)
         if match:
             return match.group(1).strip()
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_axis_card(self, text: str) -> str:
-        match = re.search(r'Card\s*Number\s*:\s*([\d\*]+)', text)
+        match = _search_at_label(text, 'Card', _AXIS_CARD_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_axis_statement_date(self, text: str) -> str:
-        match = re.search(r'Statement\s*Date\s*(\d{2}/\d{2}/\d{4})', text)
+        match = _search_at_label(text, 'Statement', _AXIS_STATEMENT_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_axis_due_date(self, text: str) -> str:
-        match = re.search(r'Payment\s*Due\s*Date\s*(\d{2}/\d{2}/\d{4})', text)
+        match = _search_at_label(text, 'Payment', _AXIS_DUE_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_axis_total_due(self, text: str) -> str:
-        match = re.search(r'Total\s*Amount\s*Due\s*r\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Total', _AXIS_TOTAL_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_axis_min_due(self, text: str) -> str:
-        match = re.search(r'Minimum\s*Amount\s*Due\s*r\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Minimum', _AXIS_MIN_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_axis_credit_limit(self, text: str) -> str:
-        match = re.search(r'Credit\s*Limit\s*r\s*([\d,]+)', text)
+        match = _search_at_label(text, 'Credit', _AXIS_CREDIT_LIMIT_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
-    
-    def _extract_axis_transactions(self, text: str) -> List[Dict]:
-        transactions = []
-        pattern = r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*(CR)?'
-        
-        lines = text.split('\n')
-        in_transaction_section = False
+        return _NOT_FOUND
+    
+    def _extract_axis_transactions(self, text: str) -> Dict[str, List[str]]:
+        dates, descriptions, amounts, types = [], [], [], []
+        for match in _iter_section_lines(text, _AXIS_TXN_HEADERS, _AXIS_TXN_RE):
+            dates.append(match.group(1))
+            descriptions.append(match.group(2).strip())
+            amounts.append(f"₹{match.group(3)}")
+            types.append(_CREDIT if match.group(4) else _DEBIT)
         
-        for line in lines:
-            if 'Transaction Date' in line:
-                in_transaction_section = True
-                continue
-            
-            if in_transaction_section and re.match(r'^\d{2}/\d{2}/\d{4}', line.strip()):
-                match = re.match(r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+([\d,]+\.?\d*)\s*(CR)?', line.strip())
-                if match:
-                    transactions.append({
-                        'date': match.group(1),
-                        'description': match.group(2).strip(),
-                        'amount': f"₹{match.group(3)}",
-                        'type': 'Credit' if match.group(4) else 'Debit'
-                    })
-        
-        return transactions
+        return {'date': dates, 'description': descriptions, 'amount': amounts, 'type': types}
     
     # ===== KOTAK EXTRACTION METHODS =====
     
     def _extract_kotak_name(self, text: str) -> str:
         # Kotak names appear as concatenated strings like "JULLYSHAILESHSHAH"
         # Look for pattern: NAME followed by "StatementDate"
-        match = re.search(r'^([A-Z]+)\s+StatementDate', text, re.MULTILINE)
+        match = _search_with_literal(text, 'StatementDate', _KOTAK_NAME_RE)
         if match:
             name = match.group(1)
             if len(name) > 6:  # Reasonable name length
@@ -365,7 +773,7 @@ class CreditCardParser:
                 # Look for patterns where lowercase letters might indicate word boundaries
                 formatted_name = self._format_kotak_name(name)
                 return formatted_name
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _format_kotak_name(self, name: str) -> str:
         """Format concatenated Kotak name by adding spaces between likely words"""
@@ -375,167 +783,144 @@ class CreditCardParser:
         return name
     
     def _extract_kotak_card(self, text: str) -> str:
-        match = re.search(r'(\d{6}X+\d{4})', text)
+        match = _search_with_literal(text, 'X', _KOTAK_CARD_RE, lead=6)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_kotak_statement_date(self, text: str) -> str:
-        match = re.search(r'Statement\s*Date\s*(\d{2}-[A-Za-z]{3}-\d{4})', text)
+        match = _search_at_label(text, 'Statement', _KOTAK_STATEMENT_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_kotak_due_date(self, text: str) -> str:
-        match = re.search(r'Remember\s*to\s*Pay\s*By\s*(\d{2}-[A-Za-z]{3}-\d{4})', text)
+        match = _search_at_label(text, 'Remember', _KOTAK_DUE_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_kotak_total_due(self, text: str) -> str:
-        match = re.search(r'Total\s*Amount\s*Due\s*Rs\.\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Total', _KOTAK_TOTAL_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_kotak_min_due(self, text: str) -> str:
-        match = re.search(r'Minimum\s*Amount\s*Due\s*Rs\.\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Minimum', _KOTAK_MIN_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_kotak_credit_limit(self, text: str) -> str:
-        match = re.search(r'Total\s*Credit\s*Limit\s*Rs\.\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Total', _KOTAK_CREDIT_LIMIT_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
-    
-    def _extract_kotak_transactions(self, text: str) -> List[Dict]:
-        transactions = []
-        pattern = r'(\d{2}/\d{2}/\d{4})\s+(.+?)\s+[A-Za-z\s]+\s+([\d,]+\.?\d*)\s*(Cr)?'
+        return _NOT_FOUND
+    
+    def _extract_kotak_transactions(self, text: str) -> Dict[str, List[str]]:
+        dates, descriptions, amounts, types = [], [], [], []
+        for match in _finditer_with_literal(text, '/', _KOTAK_TXN_RE, lead=2):
+            dates.append(match.group(1))
+            descriptions.append(match.group(2).strip())
+            amounts.append(f"₹{match.group(4)}")
+            types.append(_CREDIT if match.group(5) else _DEBIT)
         
-        for match in re.finditer(pattern, text):
-            transactions.append({
-                'date': match.group(1),
-                'description': match.group(2).strip(),
-                'amount': f"₹{match.group(3)}",
-                'type': 'Credit' if match.group(4) else 'Debit'
-            })
-        
-        return transactions
+        return {'date': dates, 'description': descriptions, 'amount': amounts, 'type': types}
     
     # ===== SBI EXTRACTION METHODS =====
     
     def _extract_sbi_name(self, text: str) -> str:
-        match = re.search(r'MR\.\s+([A-Z\s]+)', text)
+        match = _search_at_label(text, 'MR.', _SBI_NAME_RE)
         if match:
             return match.group(1).strip()
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_sbi_card(self, text: str) -> str:
-        match = re.search(r'(\d{4}\s*X+\s*X+\s*X+\s*\d{4})', text)
+        match = _search_with_literal(text, 'X', _SBI_CARD_RE)
         if match:
             return match.group(1).replace(' ', '')
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_sbi_statement_date(self, text: str) -> str:
-        match = re.search(r'Statement\s*Date\s*(\d{2}\s*[A-Z]{3}\s*\d{4})', text)
+        match = _search_at_label(text, 'Statement', _SBI_STATEMENT_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_sbi_due_date(self, text: str) -> str:
-        match = re.search(r'Payment\s*Due\s*Date\s*(\d{2}\s*[A-Z]{3}\s*\d{4})', text)
+        match = _search_at_label(text, 'Payment', _SBI_DUE_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_sbi_total_due(self, text: str) -> str:
-        match = re.search(r'Total\s*Payment\s*Due\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Total', _SBI_TOTAL_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_sbi_min_due(self, text: str) -> str:
-        match = re.search(r'Minimum\s*Payment\s*Due\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Minimum', _SBI_MIN_DUE_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_sbi_credit_limit(self, text: str) -> str:
-        match = re.search(r'Credit\s*Limit\s*([\d,]+\.?\d*)', text)
+        match = _search_at_label(text, 'Credit', _SBI_CREDIT_LIMIT_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
-    
-    def _extract_sbi_transactions(self, text: str) -> List[Dict]:
-        transactions = []
-        pattern = r'(\d{2}\.\d{2}\.\d{4})\s+([A-Z]+)\s+(.+?)\s+([\d,]+\.?\d*)'
-        
-        for match in re.finditer(pattern, text):
-            transactions.append({
-                'date': match.group(1),
-                'description': f"{match.group(2)} {match.group(3)}".strip(),
-                'amount': f"₹{match.group(4)}",
-                'type': 'Debit'
-            })
+        return _NOT_FOUND
+    
+    def _extract_sbi_transactions(self, text: str) -> Dict[str, List[str]]:
+        dates, descriptions, amounts, types = [], [], [], []
+        for match in _finditer_with_literal(text, '.', _SBI_TXN_RE, lead=2):
+            dates.append(match.group(1))
+            descriptions.append(f"{match.group(2)} {match.group(3)}".strip())
+            amounts.append(f"₹{match.group(4)}")
+            types.append(_DEBIT)
         
-        return transactions
+        return {'date': dates, 'description': descriptions, 'amount': amounts, 'type': types}
     
     # ===== GENERIC EXTRACTION METHODS =====
     
     def _extract_generic_name(self, text: str) -> str:
-        patterns = [
-            r'(?:Name|Cardholder)[:\s]*([A-Z][A-Z\s\.]+)',
-            r'(?:Mr\.|Ms\.|Mrs\.)\s*([A-Z][A-Z\s]+)',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _GENERIC_NAME_RES:
+            match = pattern.search(text)
             if match:
                 name = match.group(1).strip()
                 if 2 <= len(name.split()) <= 5:
                     return name
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_generic_card(self, text: str) -> str:
-        patterns = [
-            r'(\d{4}[\sX*]{4,}\d{4})',
-            r'Card.*?(\d{4})',
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, text)
-            if match:
-                return match.group(1)
-        return 'Not Found'
+        match = _GENERIC_CARD_RE.search(text)
+        if not match:
+            return _NOT_FOUND
+        if match.group(1):
+            return match.group(1)
+        # Only a 'Card ... 1234' hit so far; a masked number further on still wins
+        masked = _GENERIC_MASKED_CARD_RE.search(text, match.end())
+        if masked:
+            return masked.group(1)
+        return match.group(2)
     
     def _extract_generic_due_date(self, text: str) -> str:
-        pattern = r'(?:Due\s*Date|Payment\s*Due)[:\s]*(\d{1,2}[\/\-][A-Za-z]{3}[\/\-]\d{2,4}|\d{1,2}[\/\-]\d{1,2}[\/\-]\d{2,4})'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _search_at_labels(text, _GENERIC_DUE_DATE_LABELS, _GENERIC_DUE_DATE_RE)
         if match:
             return match.group(1)
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _extract_generic_amount(self, text: str) -> str:
-        pattern = r'(?:Total.*?Due|Amount.*?Due)[:\s]*(?:Rs\.?|₹)?\s*([\d,]+\.?\d*)'
-        match = re.search(pattern, text, re.IGNORECASE)
+        match = _search_at_labels(text, _GENERIC_AMOUNT_LABELS, _GENERIC_AMOUNT_RE)
         if match:
             return f"₹{match.group(1)}"
-        return 'Not Found'
+        return _NOT_FOUND
     
     def _calculate_confidence(self, data: Dict) -> int:
         """Calculate confidence score based on extracted fields"""
         found_fields = 0
-        total_fields = 0
-        
-        for key, value in data.items():
-            if key == 'transactions':
-                continue
-            total_fields += 1
-            if value and value != 'Not Found':
+        for key in _SCORED_FIELDS:
+            if data[key] not in ('', _NOT_FOUND):
                 found_fields += 1
-        
-        if total_fields == 0:
-            return 0
-        
-        confidence = int((found_fields / total_fields) * 100)
-        return confidence
\ No newline at end of file
+        return found_fields * 100 // len(_SCORED_FIELDS)
\ No newline at end of file